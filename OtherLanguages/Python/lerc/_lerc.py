@@ -53,19 +53,23 @@ if platform.system() == "Darwin":
 # helper functions:
 
 # data types supported by Lerc, all little endian byte order
+# lookup tables, built once at import instead of on every call
+
+_lercDatatypeDict = {
+    np.dtype('b'): 0,  # char   or int8
+    np.dtype('B'): 1,  # byte   or uint8
+    np.dtype('h'): 2,  # short  or int16
+    np.dtype('H'): 3,  # ushort or uint16
+    np.dtype('i'): 4,  # int    or int32
+    np.dtype('I'): 5,  # uint   or uint32
+    np.dtype('f'): 6,  # float  or float32
+    np.dtype('d'): 7   # double or float64
+    }
+
+_npDtArr = ['b', 'B', 'h', 'H', 'i', 'I', 'f', 'd']    # Lerc dataType to np data type
 
 def getLercDatatype(npDtype):
-    switcher = {
-        np.dtype('b'): 0,  # char   or int8
-        np.dtype('B'): 1,  # byte   or uint8
-        np.dtype('h'): 2,  # short  or int16
-        np.dtype('H'): 3,  # ushort or uint16
-        np.dtype('i'): 4,  # int    or int32
-        np.dtype('I'): 5,  # uint   or uint32
-        np.dtype('f'): 6,  # float  or float32
-        np.dtype('d'): 7   # double or float64
-        }
-    return switcher.get(npDtype, -1)
+    return _lercDatatypeDict.get(npDtype, -1)
 
 #-------------------------------------------------------------------------------
 
@@ -170,7 +174,7 @@ def encode(npArr, nValuesPerPixel, npValidMask, maxZErr, outBuffer, printInfo =
 
     start = timer()
     
-    if outBuffer == None:
+    if outBuffer is None:
         result = lercDll.lerc_computeCompressedSize(cpData, dataType, nValuesPerPixel, nCols, nRows, nBands, cpValidArr, maxZErr, ptr)
     else:
         result = lercDll.lerc_encode(cpData, dataType, nValuesPerPixel, nCols, nRows, nBands, cpValidArr, maxZErr, outBuffer, len(outBuffer), ptr)
@@ -182,7 +186,7 @@ def encode(npArr, nValuesPerPixel, npValidMask, maxZErr, outBuffer, printInfo =
         return (result, 0)
 
     if printInfo:
-        if outBuffer == None:
+        if outBuffer is None:
             print('time lerc_computeCompressedSize() = ', (end - start))
         else:
             print('time lerc_encode() = ', (end - start))
@@ -227,8 +231,7 @@ def decode(lercBlob, printInfo = False):
         return result
 
     # convert Lerc dataType to np data type
-    npDtArr = ['b', 'B', 'h', 'H', 'i', 'I', 'f', 'd']
-    npDtype = npDtArr[dataType]
+    npDtype = _npDtArr[dataType]
 
     # convert Lerc shape to np shape
     if nBands == 1:
@@ -242,18 +245,17 @@ def decode(lercBlob, printInfo = False):
         elif nValuesPerPixel > 1:
             shape = (nBands, nRows, nCols, nValuesPerPixel)
 
-    # create empty buffer for decoded data
-    dataSize = [1, 1, 2, 2, 4, 4, 4, 8]
-    nBytes = nBands * nRows * nCols * nValuesPerPixel * dataSize[dataType]
-    dataBuf = ct.create_string_buffer(nBytes)
-    cpData = ct.cast(dataBuf, ct.c_void_p)
+    # create zero filled np array for decoded data, lerc_decode() writes into it directly
+    # but leaves invalid pixels untouched
+    npArr = np.zeros(shape, npDtype)
+    cpData = npArr.ctypes.data_as(ct.c_void_p)
     cpBytes = ct.cast(lercBlob, ct.c_char_p)
 
-    # create empty buffer for valid pixels mask, if needed
+    # create empty np array for valid pixels mask, if needed
     cpValidArr = None
     if nValidPixels != nRows * nCols:    # not all pixels are valid, need mask
-        validBuf = ct.create_string_buffer(nRows * nCols)
-        cpValidArr = ct.cast(validBuf, ct.c_char_p)
+        npValidBytes = np.empty((nRows, nCols), 'B')
+        cpValidArr = npValidBytes.ctypes.data_as(ct.c_char_p)
 
     # call decode
     start = timer()
@@ -267,12 +269,7 @@ def decode(lercBlob, printInfo = False):
         print('time lerc_decode() = ', (end - start))
 
     # return result, np data array, and np valid pixels array if there
-    npArr = np.frombuffer(dataBuf, npDtype)
-    npArr.shape = shape
-
     if nValidPixels != nRows * nCols:
-        npValidBytes = np.frombuffer(validBuf, dtype='B')
-        npValidBytes.shape = (nRows, nCols)
         npValidMask = (npValidBytes != 0)
         return (result, npArr, npValidMask)
     else:
@@ -313,15 +313,22 @@ Contributors:  Johannes Schmid, (LERC v1)
         if (data.mask.numBytes > 0) {
           var bitset = new Uint8Array(Math.ceil(data.width * data.height / 8));
           view = new DataView(input, fp, data.mask.numBytes);
+          var rle = new Uint8Array(input, fp, data.mask.numBytes);
           var cnt = view.getInt16(0, true);
           var ip = 2, op = 0;
           do {
             if (cnt > 0) {
-              while (cnt--) { bitset[op++] = view.getUint8(ip++); }
+              if (op < bitset.length) {
+                bitset.set(rle.subarray(ip, ip + Math.min(cnt, bitset.length - op)), op);
+              }
+              ip += cnt;
+              op += cnt;
             } else {
-              var val = view.getUint8(ip++);
-              cnt = -cnt;
-              while (cnt--) { bitset[op++] = val; }
+              var val = rle[ip++];
+              var opEnd = op - cnt;
+              var end = Math.min(opEnd, bitset.length);
+              while (op < end) { bitset[op++] = val; }
+              op = opEnd;
             }
             cnt = view.getInt16(ip, true);
             ip += 2;
@@ -864,15 +871,22 @@ Contributors:  Johannes Schmid, (LERC v1)
         else if (mask.numBytes > 0) {
           bitset = new Uint8Array(Math.ceil(numPixels / 8));
           view = new DataView(input, ptr, mask.numBytes);
+          var rle = new Uint8Array(input, ptr, mask.numBytes);
           var cnt = view.getInt16(0, true);
-          var ip = 2, op = 0, val = 0;
+          var ip = 2, op = 0;
           do {
             if (cnt > 0) {
-              while (cnt--) { bitset[op++] = view.getUint8(ip++); }
+              if (op < bitset.length) {
+                bitset.set(rle.subarray(ip, ip + Math.min(cnt, bitset.length - op)), op);
+              }
+              ip += cnt;
+              op += cnt;
             } else {
-              val = view.getUint8(ip++);
-              cnt = -cnt;
-              while (cnt--) { bitset[op++] = val; }
+              var val = rle[ip++];
+              var opEnd = op - cnt;
+              var end = Math.min(opEnd, bitset.length);
+              while (op < end) { bitset[op++] = val; }
+              op = opEnd;
             }
             cnt = view.getInt16(ip, true);
             ip += 2;
@@ -380,11 +380,11 @@ bool BitStuffer2::BitUnStuff_Before_Lerc2v3(const Byte** ppByte, size_t& nBytesR
   unsigned int lastUInt = *srcPtr;
   unsigned int numBytesNotNeeded = NumTailBytesNotNeeded(numElements, numBits);
 
-  for (unsigned int n = numBytesNotNeeded; n; n--)
+  if (numBytesNotNeeded > 0)
   {
     unsigned int val;
     memcpy(&val, srcPtr, sizeof(unsigned int));
-    val <<= 8;
+    val <<= 8 * numBytesNotNeeded;    // numBytesNotNeeded <= 3
     memcpy(srcPtr, &val, sizeof(unsigned int));
   }
 
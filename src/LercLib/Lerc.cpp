@@ -136,7 +136,7 @@ ErrCode Lerc::GetLercInfo(const Byte* pLercBlob, unsigned int numBytesBlob, stru
   // only if not Lerc2, try legacy Lerc1
   unsigned int numBytesHeaderBand0 = CntZImage::computeNumBytesNeededToReadHeader(false);
   unsigned int numBytesHeaderBand1 = CntZImage::computeNumBytesNeededToReadHeader(true);
-  Byte* pByte = const_cast<Byte*>(pLercBlob);
+  const Byte* pByte = pLercBlob;
 
   lercInfo.zMin =  FLT_MAX;
   lercInfo.zMax = -FLT_MAX;
@@ -150,7 +150,7 @@ ErrCode Lerc::GetLercInfo(const Byte* pLercBlob, unsigned int numBytesBlob, stru
     if (nBytesRead < nBytesNeeded)
       return ErrCode::Failed;
 
-    Byte* ptr = const_cast<Byte*>(pLercBlob);
+    const Byte* ptr = pLercBlob;
     ptr += 10 + 2 * sizeof(int);
 
     int height(0), width(0);
@@ -168,7 +168,7 @@ ErrCode Lerc::GetLercInfo(const Byte* pLercBlob, unsigned int numBytesBlob, stru
     lercInfo.dt = Lerc::DT_Float;
     lercInfo.maxZError = maxZErrorInFile;
 
-    Byte* pByte = const_cast<Byte*>(pLercBlob);
+    const Byte* pByte = pLercBlob;
     bool onlyZPart = false;
 
     while (lercInfo.blobSize + numBytesHeaderBand1 < numBytesBlob)    // means there could be another band
@@ -186,17 +186,16 @@ ErrCode Lerc::GetLercInfo(const Byte* pLercBlob, unsigned int numBytesBlob, stru
       float zMin =  FLT_MAX;
       float zMax = -FLT_MAX;
 
-      for (int i = 0; i < height; i++)
-      {
-        for (int j = 0; j < width; j++)
-          if (cntZImg(i, j).cnt > 0)
-          {
-            numValidPixels++;
-            float z = cntZImg(i, j).z;
-            zMax = max(zMax, z);
-            zMin = min(zMin, z);
-          }
-      }
+      const CntZ* srcPtr = cntZImg.getData();
+      int num = cntZImg.getSize();
+      for (int k = 0; k < num; k++, srcPtr++)
+        if (srcPtr->cnt > 0)
+        {
+          numValidPixels++;
+          float z = srcPtr->z;
+          zMax = max(zMax, z);
+          zMin = min(zMin, z);
+        }
 
       lercInfo.numValidPixel = numValidPixels;
       lercInfo.zMin = std::min(lercInfo.zMin, (double)zMin);
@@ -359,7 +358,7 @@ ErrCode Lerc::DecodeTempl(T* pData, const Byte* pLercBlob, unsigned int numBytes
 
   const Byte* pByte = pLercBlob;
 #ifdef HAVE_LERC1_DECODE
-  Byte* pByte1 = const_cast<Byte*>(pLercBlob);
+  const Byte* pByte1 = pLercBlob;
 #endif
   Lerc2::HeaderInfo hdInfo;
 
@@ -27,9 +27,11 @@ Contributors:  Thomas Maurer
 using namespace std;
 using namespace LercNS;
 
+const int BitStuffer::s_numBytesFromBits67[4] = { 4, 2, 1, 0 };
+
 // -------------------------------------------------------------------------- ;
 
-bool BitStuffer::read(Byte** ppByte, vector<unsigned int>& dataVec)
+bool BitStuffer::read(const Byte** ppByte, vector<unsigned int>& dataVec)
 {
   if (!ppByte)
     return false;
@@ -37,8 +39,7 @@ bool BitStuffer::read(Byte** ppByte, vector<unsigned int>& dataVec)
   Byte numBitsByte = **ppByte;
   (*ppByte)++;
 
-  int bits67 = numBitsByte >> 6;
-  int n = (bits67 == 0) ? 4 : 3 - bits67;
+  int n = numBytesFromBits67(numBitsByte);
 
   numBitsByte &= 63;    // bits 0-5;
 
@@ -56,78 +57,91 @@ bool BitStuffer::read(Byte** ppByte, vector<unsigned int>& dataVec)
   if (numUInts > 0)    // numBits can be 0
   {
     unsigned int numBytes = numUInts * sizeof(unsigned int);
-    unsigned int* arr = (unsigned int*)(*ppByte);
+    unsigned int numBytesNotNeeded = numTailBytesNotNeeded(numElements, numBits);
 
-    unsigned int* srcPtr = arr;
-    for (unsigned int i = 0; i < numUInts; i++)
-    {
-      SWAP_4(*srcPtr);
-      srcPtr++;
-    }
+    unStuff(*ppByte, numUInts, numBytesNotNeeded, &dataVec[0], numElements, numBits);
 
-    // needed to save the 0-3 bytes not used in the last UInt
-    srcPtr--;
-    unsigned int lastUInt;
-    memcpy(&lastUInt, srcPtr, sizeof(unsigned int));
-    unsigned int numBytesNotNeeded = numTailBytesNotNeeded(numElements, numBits);
-    unsigned int n = numBytesNotNeeded;
-    while (n--)
+    *ppByte += numBytes - numBytesNotNeeded;
+  }
+
+  return true;
+}
+
+// -------------------------------------------------------------------------- ;
+// -------------------------------------------------------------------------- ;
+
+void BitStuffer::unStuff(const Byte* pByte, unsigned int numUInts, unsigned int numBytesNotNeeded,
+  unsigned int* dstPtr, unsigned int numElements, int numBits)
+{
+  // the blob is only read, never modified;
+  // the last 2 UInts are copied into a local buffer; the last UInt is stored w/o its 0-3 bytes not used,
+  // so copy only the bytes present and shift them up into place
+  unsigned int numUIntsFast = numUInts > 2 ? numUInts - 2 : 0;
+  unsigned int tailArr[3] = { 0, 0, 0 };
+  unsigned int numTail = numUInts - numUIntsFast;
+  memcpy(tailArr, pByte + numUIntsFast * sizeof(unsigned int), numTail * sizeof(unsigned int) - numBytesNotNeeded);
+
+  for (unsigned int k = 0; k < numTail; k++)
+    SWAP_4(tailArr[k]);
+
+  tailArr[numTail - 1] <<= 8 * numBytesNotNeeded;    // numBytesNotNeeded <= 3
+
+  if (32 % numBits == 0)    // numBits = 1, 2, 4, 8, or 16, no element spans 2 UInts, unstuff UInt by UInt
+  {
+    const unsigned int numPerUInt = 32 / numBits;
+    const int rShift = 32 - numBits;
+    unsigned int i = 0;
+
+    for (unsigned int k = 0; k + 1 < numUInts; k++)
     {
       unsigned int val;
-      memcpy(&val, srcPtr, sizeof(unsigned int));
-      val <<= 8;
-      memcpy(srcPtr, &val, sizeof(unsigned int));
+      memcpy(&val, pByte + k * sizeof(unsigned int), sizeof(unsigned int));
+      SWAP_4(val);
+
+      for (unsigned int m = 0; m < numPerUInt; m++, val <<= numBits)
+        dstPtr[i++] = val >> rShift;
     }
 
-    // do the un-stuffing
-    srcPtr = arr;
-    unsigned int* dstPtr = &dataVec[0];
-    int bitPos = 0;
+    unsigned int val = tailArr[numTail - 1];
+    for (; i < numElements; i++, val <<= numBits)
+      dstPtr[i] = val >> rShift;
 
-    for (unsigned int i = 0; i < numElements; i++)
-    {
-      if (32 - bitPos >= numBits)
-      {
-        unsigned int val;
-        memcpy(&val, srcPtr, sizeof(unsigned int));
-        unsigned int n = val << bitPos;
-        *dstPtr++ = n >> (32 - numBits);
-
-        bitPos += numBits;
-        if (bitPos == 32)    // shift >= 32 is undefined
-        {
-          bitPos = 0;
-          srcPtr++;
-        }
-      }
-      else
-      {
-        unsigned int val;
-        memcpy(&val, srcPtr, sizeof(unsigned int));
-        srcPtr++;
-        unsigned int n = val << bitPos;
-        *dstPtr = n >> (32 - numBits);
-        bitPos -= (32 - numBits);
-        memcpy(&val, srcPtr, sizeof(unsigned int));
-        *dstPtr++ |= val >> (32 - bitPos);
-      }
-    }
+    return;
+  }
 
-    if (numBytesNotNeeded > 0)
-      memcpy(srcPtr, &lastUInt, sizeof(unsigned int));    // restore the last UInt
+  // element i starts at bit i * numBits, so it can be extracted w/o any state carried over from element i - 1;
+  // each element is read from a 64 bit window over 2 consecutive UInts
+  unsigned int numElemFast = (unsigned int)((32ULL * numUIntsFast + numBits - 1) / numBits);
+  int rShift64 = 64 - numBits;
 
-    *ppByte += numBytes - numBytesNotNeeded;
+  for (unsigned int i = 0; i < numElemFast; i++)
+  {
+    unsigned long long bitPos = (unsigned long long)i * numBits;
+    const Byte* ptr = pByte + (bitPos >> 5) * sizeof(unsigned int);
+    unsigned int hi, lo;
+    memcpy(&hi, ptr, sizeof(unsigned int));
+    memcpy(&lo, ptr + sizeof(unsigned int), sizeof(unsigned int));
+    SWAP_4(hi);
+    SWAP_4(lo);
+    unsigned long long val = ((unsigned long long)hi << 32) | lo;
+    dstPtr[i] = (unsigned int)((val << (bitPos & 31)) >> rShift64);
   }
 
-  return true;
+  // the remaining elements touch the last UInt, read them from the local buffer
+  for (unsigned int i = numElemFast; i < numElements; i++)
+  {
+    unsigned long long bitPos = (unsigned long long)i * numBits - 32ULL * numUIntsFast;
+    const unsigned int* p = tailArr + (bitPos >> 5);
+    unsigned long long val = ((unsigned long long)p[0] << 32) | p[1];
+    dstPtr[i] = (unsigned int)((val << (bitPos & 31)) >> rShift64);
+  }
 }
 
-// -------------------------------------------------------------------------- ;
 // -------------------------------------------------------------------------- ;
 
-bool BitStuffer::readUInt(Byte** ppByte, unsigned int& k, int numBytes)
+bool BitStuffer::readUInt(const Byte** ppByte, unsigned int& k, int numBytes)
 {
-  Byte* ptr = *ppByte;
+  const Byte* ptr = *ppByte;
 
   if (numBytes == 1)
   {
@@ -39,11 +39,18 @@ public:
   BitStuffer()  {}
   virtual ~BitStuffer()  {}
 
-  static bool read(Byte** ppByte, std::vector<unsigned int>& dataVec);
+  static bool read(const Byte** ppByte, std::vector<unsigned int>& dataVec);
+
+  // bits 6-7 of a flag byte code the num bytes of the value that follows: 4, 2, or 1; 0 means invalid
+  static int numBytesFromBits67(Byte flagByte)  { return s_numBytesFromBits67[flagByte >> 6]; }
 
 protected:
-  static bool readUInt(Byte** ppByte, unsigned int& k, int numBytes);    // numBytes = 1, 2, or 4
+  static void unStuff(const Byte* pByte, unsigned int numUInts, unsigned int numBytesNotNeeded,
+    unsigned int* dstPtr, unsigned int numElements, int numBits);    // reads the blob, but does not modify it
+  static bool readUInt(const Byte** ppByte, unsigned int& k, int numBytes);    // numBytes = 1, 2, or 4
   static unsigned int numTailBytesNotNeeded(unsigned int numElem, int numBits);
+
+  static const int s_numBytesFromBits67[4];
 };
 
 NAMESPACE_LERC_END
@@ -31,6 +31,9 @@ Contributors:  Thomas Maurer
 using namespace std;
 using namespace LercNS;
 
+static const char s_typeStr[] = "CntZImage ";             // same as getTypeString()
+static const size_t s_typeStrLen = sizeof(s_typeStr) - 1;  // 10 bytes, w/o the terminating 0
+
 // -------------------------------------------------------------------------- ;
 
 CntZImage::CntZImage()
@@ -45,10 +48,23 @@ CntZImage::CntZImage()
 
 bool CntZImage::resizeFill0(int width, int height)
 {
-  if (!resize(width, height))
+  if (width <= 0 || height <= 0)
+    return false;
+
+  if (width == width_ && height == height_ && data_)    // reuse the buffer
+  {
+    memset(getData(), 0, width * height * sizeof(CntZ));
+    return true;
+  }
+
+  // new buffer, calloc() gets zeroed memory w/o an extra pass over it
+  clear();
+  data_ = (CntZ*)calloc(width * height, sizeof(CntZ));
+  if (!data_)
     return false;
 
-  memset(getData(), 0, width * height * sizeof(CntZ));
+  width_ = width;
+  height_ = height;
   return true;
 }
 
@@ -56,8 +72,7 @@ bool CntZImage::resizeFill0(int width, int height)
 
 unsigned int CntZImage::computeNumBytesNeededToReadHeader(bool onlyZPart)
 {
-  CntZImage zImg;
-  unsigned int cnt = (unsigned int)zImg.getTypeString().length();  // "CntZImage ", 10 bytes
+  unsigned int cnt = (unsigned int)s_typeStrLen;    // "CntZImage ", 10 bytes
   cnt += 4 * sizeof(int);       // version, type, width, height
   cnt += 1 * sizeof(double);    // maxZError
   if (!onlyZPart)
@@ -69,23 +84,21 @@ unsigned int CntZImage::computeNumBytesNeededToReadHeader(bool onlyZPart)
 
 // -------------------------------------------------------------------------- ;
 
-bool CntZImage::read(Byte** ppByte, double maxZError, bool onlyHeader, bool onlyZPart)
+bool CntZImage::read(const Byte** ppByte, double maxZError, bool onlyHeader, bool onlyZPart)
 {
   if (!ppByte || !*ppByte)
     return false;
 
-  size_t len = getTypeString().length();
-  string typeStr(len, '0');
-  memcpy(&typeStr[0], *ppByte, len);
-  *ppByte += len;
+  bool isCntZ = memcmp(*ppByte, s_typeStr, s_typeStrLen) == 0;
+  *ppByte += s_typeStrLen;
 
-  if (typeStr != getTypeString())
+  if (!isCntZ)
     return false;
 
   int version = 0, type = 0, width = 0, height = 0;
   double maxZErrorInFile = 0;
 
-  Byte* ptr = *ppByte;
+  const Byte* ptr = *ppByte;
 
   memcpy(&version, ptr, sizeof(int));  ptr += sizeof(int);
   memcpy(&type,    ptr, sizeof(int));  ptr += sizeof(int);
@@ -128,7 +141,7 @@ bool CntZImage::read(Byte** ppByte, double maxZError, bool onlyHeader, bool only
     int numTilesVert = 0, numTilesHori = 0, numBytes = 0;
     float maxValInImg = 0;
 
-    Byte* ptr = *ppByte;
+    const Byte* ptr = *ppByte;
 
     memcpy(&numTilesVert, ptr, sizeof(int));  ptr += sizeof(int);
     memcpy(&numTilesHori, ptr, sizeof(int));  ptr += sizeof(int);
@@ -136,7 +149,7 @@ bool CntZImage::read(Byte** ppByte, double maxZError, bool onlyHeader, bool only
     memcpy(&maxValInImg, ptr, sizeof(float));  ptr += sizeof(float);
 
     *ppByte = ptr;
-    Byte* bArr = ptr;
+    const Byte* bArr = ptr;
 
     SWAP_4(numTilesVert);
     SWAP_4(numTilesHori);
@@ -148,12 +161,9 @@ bool CntZImage::read(Byte** ppByte, double maxZError, bool onlyHeader, bool only
       if (numBytes == 0)    // cnt part is const
       {
         CntZ* dstPtr = getData();
-        for (int i = 0; i < height_; i++)
-          for (int j = 0; j < width_; j++)
-          {
-            dstPtr->cnt = maxValInImg;
-            dstPtr++;
-          }
+        int num = width_ * height_;
+        for (int k = 0; k < num; k++)
+          (dstPtr++)->cnt = maxValInImg;
 
         if (maxValInImg > 0)
           m_bDecoderCanIgnoreMask = true;
@@ -163,14 +173,22 @@ bool CntZImage::read(Byte** ppByte, double maxZError, bool onlyHeader, bool only
       {
         // decompress to bit mask
         BitMask bitMask(width_, height_);
+        bitMask.SetAllInvalid();    // RLE only fills as many bytes as it has encoded
         RLE rle;
         if (!rle.decompress(bArr, width_ * height_ * 2, (Byte*)bitMask.Bits(), bitMask.Size()))
           return false;
 
+        // go through the mask byte by byte, not bit by bit
+        const Byte* srcPtr = bitMask.Bits();
         CntZ* dstPtr = getData();
-        for (int k = 0, i = 0; i < height_; i++)
-          for (int j = 0; j < width_; j++, k++, dstPtr++)
-            dstPtr->cnt = bitMask.IsValid(k) ? 1.0f : 0.0f;
+        int num = width_ * height_;
+        for (int k = 0; k < num; k += 8)
+        {
+          Byte b = *srcPtr++;
+          int m = std::min(8, num - k);
+          for (int i = 0; i < m; i++, b <<= 1)
+            (dstPtr++)->cnt = (b & 128) ? 1.0f : 0.0f;
+        }
       }
     }
     else if (!readTiles(zPart, maxZErrorInFile, numTilesVert, numTilesHori, maxValInImg, bArr))
@@ -186,32 +204,35 @@ bool CntZImage::read(Byte** ppByte, double maxZError, bool onlyHeader, bool only
 // -------------------------------------------------------------------------- ;
 
 bool CntZImage::readTiles(bool zPart, double maxZErrorInFile, int numTilesVert, int numTilesHori,
-  float maxValInImg, Byte* bArr)
+  float maxValInImg, const Byte* bArr)
 {
-  Byte* ptr = bArr;
+  if (numTilesVert <= 0 || numTilesHori <= 0)
+    return false;
+
+  const Byte* ptr = bArr;
+
+  // the tile size is the same for all tiles, except for the last row and column of tiles
+  const int tileH = height_ / numTilesVert;
+  const int tileW = width_ / numTilesHori;
 
   for (int iTile = 0; iTile <= numTilesVert; iTile++)
   {
-    int tileH = height_ / numTilesVert;
     int i0 = iTile * tileH;
-    if (iTile == numTilesVert)
-      tileH = height_ % numTilesVert;
+    int i1 = (iTile < numTilesVert) ? i0 + tileH : height_;
 
-    if (tileH == 0)
+    if (i1 == i0)
       continue;
 
     for (int jTile = 0; jTile <= numTilesHori; jTile++)
     {
-      int tileW = width_ / numTilesHori;
       int j0 = jTile * tileW;
-      if (jTile == numTilesHori)
-        tileW = width_ % numTilesHori;
+      int j1 = (jTile < numTilesHori) ? j0 + tileW : width_;
 
-      if (tileW == 0)
+      if (j1 == j0)
         continue;
 
-      bool rv = zPart ? readZTile(  &ptr, i0, i0 + tileH, j0, j0 + tileW, maxZErrorInFile, maxValInImg) :
-                        readCntTile(&ptr, i0, i0 + tileH, j0, j0 + tileW);
+      bool rv = zPart ? readZTile(  &ptr, i0, i1, j0, j1, maxZErrorInFile, maxValInImg) :
+                        readCntTile(&ptr, i0, i1, j0, j1);
 
       if (!rv)
         return false;
@@ -223,10 +244,9 @@ bool CntZImage::readTiles(bool zPart, double maxZErrorInFile, int numTilesVert,
 
 // -------------------------------------------------------------------------- ;
 
-bool CntZImage::readCntTile(Byte** ppByte, int i0, int i1, int j0, int j1)
+bool CntZImage::readCntTile(const Byte** ppByte, int i0, int i1, int j0, int j1)
 {
-  Byte* ptr = *ppByte;
-  int numPixel = (i1 - i0) * (j1 - j0);
+  const Byte* ptr = *ppByte;
 
   Byte comprFlag = *ptr++;
 
@@ -259,26 +279,20 @@ bool CntZImage::readCntTile(Byte** ppByte, int i0, int i1, int j0, int j1)
   if (comprFlag == 0)
   {
     // read cnt's as flt arr uncompressed
-    const float* srcPtr = (const float*)ptr;
-
     for (int i = i0; i < i1; i++)
     {
       CntZ* dstPtr = getData() + i * width_ + j0;
-      for (int j = j0; j < j1; j++)
+      for (int j = j0; j < j1; j++, dstPtr++, ptr += sizeof(float))
       {
-        dstPtr->cnt = *srcPtr++;
+        memcpy(&dstPtr->cnt, ptr, sizeof(float));
         SWAP_4(dstPtr->cnt);
-        dstPtr++;
       }
     }
-
-    ptr += numPixel * sizeof(float);
   }
   else
   {
     // read cnt's as int arr bit stuffed
-    int bits67 = comprFlag >> 6;
-    int n = (bits67 == 0) ? 4 : 3 - bits67;
+    int n = BitStuffer::numBytesFromBits67(comprFlag);
 
     float offset = 0;
     if (!readFlt(&ptr, offset, n))
@@ -308,13 +322,12 @@ bool CntZImage::readCntTile(Byte** ppByte, int i0, int i1, int j0, int j1)
 
 // -------------------------------------------------------------------------- ;
 
-bool CntZImage::readZTile(Byte** ppByte, int i0, int i1, int j0, int j1, double maxZErrorInFile, float maxZInImg)
+bool CntZImage::readZTile(const Byte** ppByte, int i0, int i1, int j0, int j1, double maxZErrorInFile, float maxZInImg)
 {
-  Byte* ptr = *ppByte;
-  int numPixel = 0;
+  const Byte* ptr = *ppByte;
 
   Byte comprFlag = *ptr++;
-  int bits67 = comprFlag >> 6;
+  int n = BitStuffer::numBytesFromBits67(comprFlag);
   comprFlag &= 63;
 
   if (comprFlag == 2)    // entire zTile is constant 0 (if valid or invalid doesn't matter)
@@ -339,44 +352,62 @@ bool CntZImage::readZTile(Byte** ppByte, int i0, int i1, int j0, int j1, double
 
   if (comprFlag == 0)
   {
-    // read z's as flt arr uncompressed
-    const float* srcPtr = (const float*)ptr;
-
+    // read z's as flt arr uncompressed, one flt for each valid pixel
     for (int i = i0; i < i1; i++)
     {
       CntZ* dstPtr = getData() + i * width_ + j0;
-      for (int j = j0; j < j1; j++)
+
+      if (m_bDecoderCanIgnoreMask)    // all pixels valid, no need to check the cnt
       {
-        if (dstPtr->cnt > 0)
+        for (int j = j0; j < j1; j++, dstPtr++, ptr += sizeof(float))
         {
-          dstPtr->z = *srcPtr++;
+          memcpy(&dstPtr->z, ptr, sizeof(float));
           SWAP_4(dstPtr->z);
-          numPixel++;
         }
-        dstPtr++;
+      }
+      else
+      {
+        for (int j = j0; j < j1; j++, dstPtr++)
+        {
+          if (dstPtr->cnt > 0)
+          {
+            memcpy(&dstPtr->z, ptr, sizeof(float));
+            SWAP_4(dstPtr->z);
+            ptr += sizeof(float);
+          }
+        }
       }
     }
-
-    ptr += numPixel * sizeof(float);
   }
   else
   {
     // read z's as int arr bit stuffed
-    int n = (bits67 == 0) ? 4 : 3 - bits67;
     float offset = 0;
     if (!readFlt(&ptr, offset, n))
       return false;
 
     if (comprFlag == 3)
     {
-      for (int i = i0; i < i1; i++)
+      if (m_bDecoderCanIgnoreMask)
       {
-        CntZ* dstPtr = getData() + i * width_ + j0;
-        for (int j = j0; j < j1; j++)
+        for (int i = i0; i < i1; i++)
         {
-          if (dstPtr->cnt > 0)
-            dstPtr->z = offset;
-          dstPtr++;
+          CntZ* dstPtr = getData() + i * width_ + j0;
+          for (int j = j0; j < j1; j++)
+            (dstPtr++)->z = offset;
+        }
+      }
+      else
+      {
+        for (int i = i0; i < i1; i++)
+        {
+          CntZ* dstPtr = getData() + i * width_ + j0;
+          for (int j = j0; j < j1; j++)
+          {
+            if (dstPtr->cnt > 0)
+              dstPtr->z = offset;
+            dstPtr++;
+          }
         }
       }
     }
@@ -387,6 +418,12 @@ bool CntZImage::readZTile(Byte** ppByte, int i0, int i1, int j0, int j1, double
       if (!bitStuffer.read(&ptr, dataVec))
         return false;
 
+      if (dataVec.empty())    // no valid pixels in this tile, skip the loop over its pixels
+      {
+        *ppByte = ptr;
+        return true;
+      }
+
       double invScale = 2 * maxZErrorInFile;
       unsigned int* srcPtr = &dataVec[0];
 
@@ -437,13 +474,13 @@ int CntZImage::numBytesFlt(float z)
 
 // -------------------------------------------------------------------------- ;
 
-bool CntZImage::readFlt(Byte** ppByte, float& z, int numBytes)
+bool CntZImage::readFlt(const Byte** ppByte, float& z, int numBytes)
 {
-  Byte* ptr = *ppByte;
+  const Byte* ptr = *ppByte;
 
   if (numBytes == 1)
   {
-    char c = *((char*)ptr);
+    char c = *((const char*)ptr);
     z = c;
   }
   else if (numBytes == 2)
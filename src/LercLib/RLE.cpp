@@ -315,13 +315,14 @@ bool RLE::decompress(const Byte* arrRLE, size_t nBytesRemaining, Byte* arr, size
 
     if (cnt > 0)
     {
-      while (i--) arr[arrIdx++] = *srcPtr++;
+      memcpy(arr + arrIdx, srcPtr, i);    // literal run
+      srcPtr += i;
     }
     else
     {
-      Byte b = *srcPtr++;
-      while (i--) arr[arrIdx++] = b;
+      memset(arr + arrIdx, *srcPtr++, i);    // repeated byte
     }
+    arrIdx += i;
 
     nBytesRemaining -= m + 2;
     cnt = readCount(&srcPtr);